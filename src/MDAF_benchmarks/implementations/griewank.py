@@ -52,6 +52,6 @@ class Griewank(of.ObjectiveFunction):
         """
 
         term1 = np.sum(position**2) / 4000
-        term2 = np.prod(np.cos(position / np.sqrt(np.arange(1, len(position) + 1))))
+        term2 = np.prod(np.cos(position / np.sqrt(np.arange(1, position.shape[-1] + 1))))
 
         return term1 - term2 + 1
@@ -57,6 +57,6 @@ class Michalewicz(of.ObjectiveFunction):
         """
         return -np.sum(
             np.sin(position)
-            * (np.sin((np.arange(1, len(position) + 1) * position**2) / np.pi))
+            * (np.sin((np.arange(1, position.shape[-1] + 1) * position**2) / np.pi))
             ** (2 * self.parameters["m"])
         )
@@ -1,26 +1,26 @@
-import inspect
 import logging
 import os
 import pickle
-import re
-import timeit
+import weakref
 from abc import ABC, abstractmethod
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import cached_property
 from numbers import Number
-from typing import Callable, Iterable, Optional
+from time import perf_counter_ns
+from typing import Callable, Iterable, Iterator, Optional
 
-import matplotlib.pyplot as plt
+import cloudpickle
 import numpy as np
-from autograd import grad, hessian
-from line_profiler import LineProfiler
 from src.MDAF_benchmarks.default_settings import DefaultSettings
 
 # Internal constants
 LEFT_CLICK = 1
 RIGHT_CLICK = 3
 
-# Internal paths
-DECOUPLED_FUNCTION_PATH = "./src/objective_functions/tmp/decoupled_evaluate.py"
+# Minimum number of values for which the compiled noise kernel beats NumPy, below it the per-call overhead dominates
+NOISE_KERNEL_MIN_SIZE = 1000
 
 # Create module-specific logger with default warning level set to WARNING
 logger = logging.getLogger(__name__)
@@ -69,7 +69,7 @@ class ColorFormatter(logging.Formatter):
         # Format the message with the color code by sending it to the formatter
         message = super().format(record)
 
-        return f"{color}{message}'\033[0m"
+        return f"{color}{message}\033[0m"
 
 
 # Create a console handler for color formatting
@@ -91,26 +91,148 @@ def set_verbose_warnings(enabled: bool = True) -> None:
     logger.setLevel(logging.WARNING if enabled else logging.ERROR)
 
 
-def count_calls(foo: Callable) -> Callable:
+# Numba-compiled kernels, built on first use so that importing this module does not import Numba
+_compiled_kernels: dict = {}
+
+
+def _compiled(kernel: Callable) -> Callable:
     """
-    Decorator that increments and stores the number of calls to a method.
+    Returns the Numba-compiled version of the given kernel, compiling it on first use.
 
     Args:
-        foo (Callable): The function to count the number of calls to.
+        kernel (Callable): The kernel to compile.
 
     Returns:
-        Callable: The decorated function.
+        Callable: The compiled kernel.
     """
+    if kernel not in _compiled_kernels:
+        from numba import njit
 
-    def wrapper(self, *args, **kwargs):
+        _compiled_kernels[kernel] = njit(cache=True)(kernel)
 
-        # Increment the number of calls
-        self.nb_calls += 1
+    return _compiled_kernels[kernel]
 
-        # Call the original function
-        return foo(self, *args, **kwargs)
 
-    return wrapper
+def _add_noise(
+    values: np.ndarray, mean: float, variance: float, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Kernel that adds Gaussian noise to the given values in a single pass. Meant to be called through _compiled.
+
+    Args:
+        values (np.ndarray): The objective function values.
+        mean (float): The mean of the Gaussian noise.
+        variance (float): The variance of the Gaussian noise.
+        rng (np.random.Generator): The random number generator used to draw the noise.
+
+    Returns:
+        np.ndarray: The noisy objective function values.
+    """
+    noisy_values = np.empty(values.shape[0])
+    for i in range(values.shape[0]):
+        noisy_values[i] = values[i] + mean + rng.standard_normal() * variance
+    return noisy_values
+
+
+def _violates_bounds(position: np.ndarray, lows: np.ndarray, highs: np.ndarray) -> bool:
+    """
+    Kernel that checks whether the given position(s) lie outside the bounds in a single pass with early exit. Meant
+    to be called through _compiled.
+
+    Args:
+        position (np.ndarray): The flattened position(s) to check.
+        lows (np.ndarray): The lower bounds of each dimension.
+        highs (np.ndarray): The upper bounds of each dimension.
+
+    Returns:
+        bool: True if any coordinate lies outside its bounds, False otherwise.
+    """
+    ndim = lows.shape[0]
+    for i in range(position.shape[0]):
+        value = position[i]
+        if value < lows[i % ndim] or value > highs[i % ndim]:
+            return True
+    return False
+
+
+def compile_kernels() -> None:
+    """
+    Compiles the Numba kernels ahead of time for the argument types used by the ObjectiveFunction class.
+
+    The compiled code is written to Numba's on-disk cache. Calling this function once at deployment (e.g., while
+    building a container image) removes the JIT cold start of check_constraints and of the noise added to the
+    parallel_evaluate results and visualization grids in later processes.
+
+    Returns:
+        None
+    """
+
+    # Representative arguments matching the call sites
+    vector = np.zeros(2)
+    rng = np.random.default_rng()
+
+    # Noise on parallel evaluation results and on visualization grids
+    _compiled(_add_noise)(vector, 0.0, 0.0, rng)
+
+    # Search space bounds check
+    _compiled(_violates_bounds)(vector, vector, vector)
+
+
+# Objective function instance deserialized in each parallel_evaluate worker process
+_worker_objective_function = None
+
+
+def _init_worker(objective_function_payload: bytes) -> None:
+    """
+    Initializes a parallel_evaluate worker process by deserializing the objective function it evaluates.
+
+    Args:
+        objective_function_payload (bytes): The objective function serialized with cloudpickle.
+
+    Returns:
+        None
+    """
+    global _worker_objective_function
+    _worker_objective_function = cloudpickle.loads(objective_function_payload)
+
+
+def _evaluate_position(objective_function: "ObjectiveFunction", position: np.ndarray) -> float:
+    """
+    Evaluates the given objective function at a single position. Adds shift if specified. The noise is added by the
+    caller so that it is drawn in input order from the objective function's generator.
+
+    Args:
+        objective_function (ObjectiveFunction): The objective function to evaluate.
+        position (np.ndarray): The position to evaluate.
+
+    Returns:
+        float: The objective function value at the given position, or NaN if the evaluation failed.
+    """
+
+    # Skip the shift when none has been applied
+    if objective_function._shift_nonzero:
+        position = position - objective_function.shift
+
+    # Report failures as NaN so that the ordered results are never interrupted, implementations that reshape the
+    # position to a batch of one return a single-element array which is unwrapped to a scalar
+    try:
+        return np.asarray(objective_function.evaluate(position), dtype=np.float64).item()
+    except Exception as e:
+        logger.error("Position %s generated an exception: %s", position, e)
+        return np.nan
+
+
+def _worker_evaluate(position: np.ndarray) -> float:
+    """
+    Evaluates the worker's objective function at the given position. Adds shift if specified.
+
+    Args:
+        position (np.ndarray): The position to evaluate.
+
+    Returns:
+        float: The objective function value at the given position, or NaN if the evaluation failed.
+    """
+    return _evaluate_position(_worker_objective_function, position)
 
 
 def constructor(foo: Callable):
@@ -125,7 +247,7 @@ def constructor(foo: Callable):
 
     """
 
-    def wrapper(self, **kwargs):
+    def wrapper(self, *, seed: Optional[int] = None, **kwargs):
 
         # Initialize parameters
         self.parameters = {}
@@ -134,14 +256,26 @@ def constructor(foo: Callable):
         foo(self, **kwargs)
 
         # Call the super constructor
-        super(self.__class__, self).__init__(**kwargs)
+        super(self.__class__, self).__init__(seed=seed)
 
     return wrapper
 
 
 class ObjectiveFunction(ABC):
 
-    def __init__(self):
+    # Caches that are rebuilt on demand and therefore excluded from the serialized state
+    _TRANSIENT_ATTRIBUTES = (
+        "_worker_payload",
+        "_worker_state",
+        "_executor",
+        "_executor_workers",
+        "_executor_finalizer",
+    )
+
+    # Cached properties holding unpicklable closures, dropped from the serialized state and rebuilt on first access
+    _CACHED_PROPERTIES = ("first_derivative", "second_derivative")
+
+    def __init__(self, seed: Optional[int] = None):
 
         # Measure the dimensionality of the provided optimal solution position
         if np.any(self.optimal_solution_position):
@@ -161,22 +295,91 @@ class ObjectiveFunction(ABC):
                 )
 
             # Validate the size of the search space bounds
-            if len(self.search_space_bounds) != self.ndim:
+            if (
+                self.search_space_bounds is not None
+                and len(self.search_space_bounds) != self.ndim
+            ):
                 raise ValueError(
                     "The size of the search space bounds must match the dimensionality of the objective function."
                 )
 
-        # Initialize shift
-        self.shift: np.ndarray = np.zeros(self.ndim)
+        # Normalize the search space bounds once into lower and upper bound arrays, left empty when none are defined
+        if self.search_space_bounds is None:
+            self._bounds = np.empty((0, 2))
+        else:
+            self._bounds = np.ascontiguousarray(
+                self.search_space_bounds, dtype=np.float64
+            ).reshape(-1, 2)
+        self._lows = np.ascontiguousarray(self._bounds[:, 0])
+        self._highs = np.ascontiguousarray(self._bounds[:, 1])
+
+        # Initialize shift as a read-only buffer
+        self.shift = np.zeros(self.ndim)
         self.noise_mean: float = 0.0
         self.noise_variance: float = 0.0
 
+        # Initialize the random number generator used for noise and sampling
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+
         # Initialize the number of objective function evaluations
         self.nb_calls: int = 0
+        self._count: bool = True
+
+        # Initialize the serialized state shipped to the parallel_evaluate workers
+        self._worker_payload: Optional[bytes] = None
+        self._worker_state: Optional[tuple] = None
+
+        # Initialize the long-lived parallel_evaluate worker pool
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_workers: Optional[int] = None
+        self._executor_finalizer: Optional[weakref.finalize] = None
+
+    @property
+    def shift(self) -> np.ndarray:
+        """
+        The read-only shift vector subtracted from the positions before evaluation.
+
+        Returns:
+            np.ndarray: The shift vector.
+        """
+        return self._shift
+
+    @shift.setter
+    def shift(self, shift: np.ndarray) -> None:
+        # Store a read-only contiguous copy of the shift vector
+        self._shift = np.array(shift, dtype=np.float64)
+        self._shift.flags.writeable = False
+        self._shift_nonzero = bool(np.any(self._shift))
+
+    @cached_property
+    def first_derivative(self) -> Callable:
+        """
+        Builds the first derivative of the objective function on first access. Only the deterministic part of the
+        objective function is differentiated (i.e., the noise is excluded).
+
+        Returns:
+            Callable: The first derivative of the shifted objective function.
+        """
+
+        # Deferred import to keep autograd out of the module import time
+        from autograd import grad
 
-        # Compute the first and second derivatives of the objective function's evaluation method
-        self.first_derivative = grad(self.__evaluate)
-        self.second_derivative = hessian(self.__evaluate)
+        return grad(lambda position: self.evaluate(position - self.shift))
+
+    @cached_property
+    def second_derivative(self) -> Callable:
+        """
+        Builds the second derivative of the objective function on first access. Only the deterministic part of the
+        objective function is differentiated (i.e., the noise is excluded).
+
+        Returns:
+            Callable: The second derivative of the shifted objective function.
+        """
+
+        # Deferred import to keep autograd out of the module import time
+        from autograd import hessian
+
+        return hessian(lambda position: self.evaluate(position - self.shift))
 
     def validate_parameters(self, parameters: dict, default_params: dict):
         """
@@ -210,7 +413,9 @@ class ObjectiveFunction(ABC):
             else:
                 default_value = default_params[parameter_name]
                 logger.warning(
-                    f"The '{parameter_name}' parameter is not set. Default value of {default_value} is used instead."
+                    "The '%s' parameter is not set. Default value of %s is used instead.",
+                    parameter_name,
+                    default_value,
                 )
                 self.parameters[parameter_name] = default_value
 
@@ -233,7 +438,9 @@ class ObjectiveFunction(ABC):
             else:
                 default_value = default_settings[setting_name]
                 logger.warning(
-                    f"The '{setting_name}' setting is not set. The default value of {default_value} is used."
+                    "The '%s' setting is not set. The default value of %s is used.",
+                    setting_name,
+                    default_value,
                 )
                 self.__dict__[setting_name] = default_value
 
@@ -242,6 +449,9 @@ class ObjectiveFunction(ABC):
         """
         Evaluates the objective function at the given position.
 
+        Implementations should support batches of positions of shape (nb_positions, ndim) and return one value
+        per position so that bulk evaluations (e.g., visualization grids) can be done in a single call.
+
         Args:
             solution (np.ndarray): The solution to evaluate.
 
@@ -250,22 +460,24 @@ class ObjectiveFunction(ABC):
         """
         pass
 
-    @count_calls
-    def __evaluate(self, position: np.ndarray) -> float:
+    @contextmanager
+    def silenced_counting(self) -> Iterator["ObjectiveFunction"]:
         """
-        Evaluates the objective function at the given position. Adds noise and shift if specified
-
-        Args:
-            solution (np.ndarray): The solution to evaluate.
+        Context manager that suspends the automated accounting of evaluations. Useful for hot loops where the
+        number of evaluations is known beforehand and can be added to nb_calls in one shot.
 
         Returns:
-            float: The objective function value at the given solution.
+            Iterator[ObjectiveFunction]: The objective function instance with counting disabled.
         """
-        return (
-            self.evaluate(position - self.shift)
-            + self.noise_mean
-            + np.random.randn(position.shape[0]) * self.noise_variance
-        )
+
+        # Store the current state to support nested contexts
+        previous_count = self._count
+        self._count = False
+
+        try:
+            yield self
+        finally:
+            self._count = previous_count
 
     def time(
         self, nb_runs: int = 10000, output: bool = False
@@ -281,34 +493,38 @@ class ObjectiveFunction(ABC):
             list[float, (float, float)]: The average execution time of the evaluate method a 95% bootstrap confidence interval.
         """
 
-        # Wrap the evaluation function
-        def wrapper():
-            position = np.array(
-                [np.random.uniform(low, high) for low, high in self.search_space_bounds]
-            )
-            return self.evaluate(position)
-
-        # Generate the bootstrap sample
-        bootstrap_times = np.array(
-            [timeit.timeit(wrapper, number=1) for _ in range(nb_runs)]
+        # Generate all the positions beforehand to keep their construction out of the timed region
+        positions = self._rng.uniform(
+            self._lows, self._highs, size=(nb_runs, len(self._bounds))
         )
 
-        # Calculate the average execution time
-        mean_time = np.mean(bootstrap_times)
+        # Generate the bootstrap sample in nanoseconds
+        bootstrap_times = np.empty(nb_runs, dtype=np.int64)
+        for i in range(nb_runs):
+            start = perf_counter_ns()
+            self.evaluate(positions[i])
+            bootstrap_times[i] = perf_counter_ns() - start
+
+        # Calculate the average execution time in seconds
+        mean_time = np.mean(bootstrap_times) * 1e-9
 
-        # Calculate the 95% confidence interval
-        lower_bound = np.percentile(bootstrap_times, 2.5)
-        upper_bound = np.percentile(bootstrap_times, 97.5)
+        # Calculate the 95% confidence interval in seconds
+        lower_bound = np.percentile(bootstrap_times, 2.5) * 1e-9
+        upper_bound = np.percentile(bootstrap_times, 97.5) * 1e-9
 
         if output:
             return [mean_time, (lower_bound, upper_bound)]
         else:
             logger.info(
-                f"Execution time (n={nb_runs}): {mean_time:.3e} 95% CI ({lower_bound:.3e}, {upper_bound:.3e})"
+                "Execution time (n=%d): %.3e 95%% CI (%.3e, %.3e)",
+                nb_runs,
+                mean_time,
+                lower_bound,
+                upper_bound,
             )
 
     def parallel_evaluate(
-        self, positions: np.ndarray, max_workers: int = None
+        self, positions: np.ndarray, max_workers: int = None, min_cost_us: float = 0.0
     ) -> np.ndarray:
         """
         Evaluates multiple positions in parallel.
@@ -316,63 +532,165 @@ class ObjectiveFunction(ABC):
         Args:
             positions (np.ndarray): An array of positions to evaluate. Each row corresponds to a position.
             max_workers (int): The maximum number of processes that can be used to execute the given calls.
+            min_cost_us (float, optional): The minimum cost of a single evaluation in microseconds for the parallel
+                                           evaluation to be worthwhile. Cheaper objective functions are evaluated
+                                           serially. Defaults to 0.0 (always parallel).
 
         Returns:
             np.ndarray: An array of objective function values corresponding to the input positions.
         """
 
-        try:
+        # Account for all the evaluations in one shot
+        if self._count:
+            self.nb_calls += len(positions)
 
-            # Export the evaluate function as a top-level function in a separate file
-            self.__decouple_evaluate()
+        # Values of the leading positions evaluated in the main process
+        serial_values = []
 
-            # Import the decoupled evaluate function
-            if os.path.exists(DECOUPLED_FUNCTION_PATH):
-                try:
-                    from MDAF_benchmarks.tmp.decoupled_evaluate import (  # type: ignore
-                        evaluate as decoupled_evaluate,
-                    )
-                except Exception as e:
-                    raise ImportError(
-                        f"Failed to import the decoupled evaluate method with traceback: {e}"
-                    )
+        # Parallelism only pays off above a per-evaluation cost threshold, evaluate serially below it
+        if min_cost_us > 0.0 and len(positions) > 0:
+
+            # Measure the cost of a single evaluation
+            start = perf_counter_ns()
+            serial_values.append(_evaluate_position(self, positions[0]))
+            cost_us = (perf_counter_ns() - start) * 1e-3
 
-        except Exception as e:
+            if cost_us < min_cost_us:
+                serial_values.extend(
+                    _evaluate_position(self, position) for position in positions[1:]
+                )
+                return self.__add_noise(np.array(serial_values, dtype=np.float64))
+
+            # Only the remaining positions are sent to the workers
+            positions = positions[1:]
+
+        # Batch several positions per inter-process round-trip
+        nb_workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(positions) // (nb_workers * 4))
+
+        # The workers hold a copy of the objective function, discard it if the state changed since it was shipped
+        worker_state = self.__snapshot_worker_state()
+        if worker_state != self._worker_state:
+            self.shutdown_workers()
+            self._worker_payload = None
+            self._worker_state = worker_state
 
-            # Delete the decoupled evaluate function file
-            self.__delete_decoupled_evaluate()
+        # Reuse the worker pool across calls unless the number of workers changed
+        if self._executor is None or self._executor_workers != max_workers:
 
-            raise Exception(
-                f"Failed to decouple the evaluate method with traceback: {e}"
+            self.shutdown_workers()
+
+            # Ship the objective function to each worker once
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self.__serialize_for_workers(),),
             )
+            self._executor_workers = max_workers
 
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # Shut the pool down once this objective function is garbage-collected, or at the latest at exit
+            self._executor_finalizer = weakref.finalize(self, self._executor.shutdown)
 
-            # Submit all evaluations to the executor
-            future_to_index = {
-                executor.submit(decoupled_evaluate, pos): i
-                for i, pos in enumerate(positions)
-            }
+        # Collect results in input order, failed positions are reported as NaN by the workers
+        try:
+            results = np.fromiter(
+                self._executor.map(_worker_evaluate, positions, chunksize=chunksize),
+                dtype=np.float64,
+                count=len(positions),
+            )
+        except BrokenProcessPool as e:
+            logger.error("The worker pool broke during the parallel evaluation: %s", e)
+
+            # A crashed worker breaks the pool, start a fresh one on the next call
+            self.shutdown_workers()
 
-            # Pre-fill with NaNs to mark failed positions clearly
             results = np.full(len(positions), np.nan)
 
-            # Collect results as they are completed
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                try:
-                    result = future.result()
-                except Exception as e:
-                    logger.error(
-                        f"Position at index {index} generated an exception: {e}"
-                    )
-                else:
-                    results[index] = result
+        # Prepend the value measured in the main process, if any
+        if serial_values:
+            results = np.concatenate((serial_values, results))
+
+        return self.__add_noise(results)
+
+    def __add_noise(self, values: np.ndarray) -> np.ndarray:
+        """
+        Adds the noise to the given values in a single draw from the objective function's generator.
+
+        Args:
+            values (np.ndarray): The objective function values.
+
+        Returns:
+            np.ndarray: The noisy objective function values.
+        """
+
+        # Skip the noise draw when no noise has been applied
+        if self.noise_variance == 0.0:
+            return values + self.noise_mean if self.noise_mean else values
+
+        # Small batches are cheaper in NumPy, both draw the same normal variates from the generator
+        if values.shape[0] < NOISE_KERNEL_MIN_SIZE:
+            return (
+                values
+                + self.noise_mean
+                + self._rng.standard_normal(values.shape[0]) * self.noise_variance
+            )
+
+        # Cast the noise parameters so that the kernel is always called with the signature compiled ahead of time
+        return _compiled(_add_noise)(
+            values, float(self.noise_mean), float(self.noise_variance), self._rng
+        )
+
+    def shutdown_workers(self) -> None:
+        """
+        Shuts down the parallel_evaluate worker pool. A new pool is started on the next parallel evaluation.
 
-        # Delete the decoupled evaluate function file
-        self.__delete_decoupled_evaluate()
+        Args:
+            None
 
-        return results
+        Returns:
+            None
+        """
+        if self._executor is not None:
+            # Calling the finalizer shuts the pool down and detaches it
+            self._executor_finalizer()
+            self._executor = None
+            self._executor_workers = None
+            self._executor_finalizer = None
+
+    def __evaluate_grid(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a visualization grid in a single batched call. Adds noise and shift if specified.
+
+        Args:
+            positions (np.ndarray): The grid positions to evaluate. Each row (or entry for 1D grids) is a position.
+
+        Returns:
+            np.ndarray: The objective function values at the grid positions.
+        """
+
+        # Skip the shift when none has been applied
+        if self._shift_nonzero:
+            positions = positions - self.shift
+
+        # Try a single batched call first
+        try:
+            values = np.asarray(self.evaluate(positions), dtype=np.float64)
+            is_batched = values.shape == (positions.shape[0],)
+        except Exception:
+            is_batched = False
+
+        # Fall back to row-wise evaluation for objective functions that do not support batches
+        if not is_batched:
+            values = np.apply_along_axis(
+                self.evaluate, 1, positions.reshape(positions.shape[0], -1)
+            ).astype(np.float64).reshape(positions.shape[0])
+
+        # Account for all the grid evaluations in one shot
+        if self._count:
+            self.nb_calls += positions.shape[0]
+
+        # Add the noise in a single draw for the whole grid
+        return self.__add_noise(values)
 
     def visualize(
         self,
@@ -397,6 +715,9 @@ class ObjectiveFunction(ABC):
             AssertionError: If the number of bounds does not match the number of dimensions.
         """
 
+        # Deferred import since pyplot loads a GUI backend
+        import matplotlib.pyplot as plt
+
         # Initialize defaults
         if plot_2d_kwargs is None:
             plot_2d_kwargs = {}
@@ -414,7 +735,7 @@ class ObjectiveFunction(ABC):
                 "The number of bounds must match the number of dimensions."
             )
         elif not plot_bounds:
-            plot_bounds = self.search_space_bounds
+            plot_bounds = self._bounds
 
         if self.ndim == 1 or len(dimensions) == 1:
 
@@ -424,8 +745,9 @@ class ObjectiveFunction(ABC):
             # Define the grid for the single dimension
             x = np.linspace(plot_bounds[0][0], plot_bounds[0][1], resolution)
 
-            # Vectorized evaluation of the objective function
-            y = self.__evaluate(x)
+            # Vectorized evaluation of the objective function, ignoring floating-point warnings from singular points
+            with np.errstate(divide="ignore", invalid="ignore"):
+                y = self.__evaluate_grid(x)
 
             # Draw the line plot
             ax.plot(x, y)
@@ -457,12 +779,16 @@ class ObjectiveFunction(ABC):
             # Vectorized evaluation of the objective function
             positions = np.vstack([X.ravel(), Y.ravel()]).T
 
-            Z = np.array(
-                [self.__evaluate(position.reshape(1, -1)) for position in positions]
-            ).reshape(X.shape)
+            # Ignore floating-point warnings from singular grid points (e.g., divisions by zero)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                Z = self.__evaluate_grid(positions).reshape(X.shape)
+
+            # Compute the range of the grid values once, ignoring NaNs
+            z_min = np.fmin.reduce(Z, axis=None)
+            z_max = np.fmax.reduce(Z, axis=None)
 
             # Draw the contour plot with level curves
-            levels = np.linspace(np.min(Z), np.max(Z), num=min(resolution // 10, 10))
+            levels = np.linspace(z_min, z_max, num=min(resolution // 10, 10))
             cs = axs[0].contourf(X, Y, Z, levels=levels, **plot_2d_kwargs)
             axs[0].contour(cs, colors="k", linewidths=1.0)
             axs[0].set_xlabel(f"X{dimensions[0]}")
@@ -517,7 +843,7 @@ class ObjectiveFunction(ABC):
                     axs[1].scatter(
                         x,
                         y,
-                        self.__evaluate(np.array([[x, y]])),
+                        self.__evaluate_grid(np.array([[x, y]])),
                         color="red",
                         marker="o",
                         s=100,
@@ -581,6 +907,11 @@ class ObjectiveFunction(ABC):
         Returns:
             np.ndarray: The first derivative of the objective function at the given position.
         """
+
+        # Each derivative evaluation counts as a call to the objective function
+        if self._count:
+            self.nb_calls += 1
+
         return self.first_derivative(position)
 
     def compute_second_derivative(self, position: np.ndarray) -> np.ndarray:
@@ -593,6 +924,11 @@ class ObjectiveFunction(ABC):
         Returns:
             np.ndarray: The second derivative of the objective function at the given position.
         """
+
+        # Each derivative evaluation counts as a call to the objective function
+        if self._count:
+            self.nb_calls += 1
+
         return self.second_derivative(position)
 
     def check_constraints(self, position: np.ndarray) -> bool:
@@ -607,19 +943,24 @@ class ObjectiveFunction(ABC):
 
         Raises:
             ValueError: If no constraints on the search space have been defined for this objective function.
+            ValueError: If the size of the position(s) is not a multiple of the dimensionality.
         """
 
         # Check if the search space bounds have been defined
-        if not self.search_space_bounds:
+        if self._bounds.size == 0:
             raise ValueError(
                 "No constraints on the search space have been defined for this objective function."
             )
 
+        # The kernel checks the flattened position(s) one dimension after the other
+        position = np.ascontiguousarray(position, dtype=np.float64).ravel()
+        if position.size % len(self._lows) != 0:
+            raise ValueError(
+                "The size of the position(s) must be a multiple of the dimensionality of the objective function."
+            )
+
         # Check if the solution satisfies the constraints for each dimension
-        return np.any(
-            (position < self.search_space_bounds[:, 0])
-            | (position > self.search_space_bounds[:, 1])
-        )
+        return _compiled(_violates_bounds)(position, self._lows, self._highs)
 
     def apply_shift(self, shift: np.ndarray) -> None:
         """
@@ -664,7 +1005,7 @@ class ObjectiveFunction(ABC):
         """
         with open(path, "wb") as file:
             pickle.dump(self, file)
-            logger.info("ObjectiveFunction state saved in {path}")
+            logger.info("ObjectiveFunction state saved in %s", path)
 
     @staticmethod
     def load(path: str):
@@ -679,160 +1020,72 @@ class ObjectiveFunction(ABC):
         """
         with open(path, "rb") as f:
             obj = pickle.load(f)
-            logger.info("ObjectiveFunction state loaded from {path}")
+            logger.info("ObjectiveFunction state loaded from %s", path)
             return obj
 
-    def __remove_self_references(self, code: str) -> str:
+    def __snapshot_worker_state(self) -> tuple:
         """
-        Removes self-references from the given code by replacing 'self.parameters['...']' with corresponding literal values.
+        Snapshots the state the parallel_evaluate workers depend on, so that changes made by direct assignment are
+        detected as well as those made through apply_shift. The noise is added in the main process and is therefore
+        left out.
 
         Args:
-            code (str): The code string to remove self-references from.
+            None
 
         Returns:
-            str: The modified code string with self-references removed.
+            tuple: The class of the objective function and its serialized shift and parameters.
         """
+        return (type(self), cloudpickle.dumps((self.shift, self.parameters)))
 
-        # Find all the self-references in the code
-        match_expr = re.findall("self.parameters\[\s*'\s*.\s*'\s*\]", code)
-        match_para = re.findall("self.parameters\[\s*'\s*(.)\s*'\s*\]", code)
-
-        # Replace the self-references with the corresponding literal values
-        for para, expr in zip(match_para, match_expr):
-            code = code.replace(expr, str(self.parameters[para]))
-
-        return code
-
-    def __remove_docstrings(self, code: str) -> str:
+    def __serialize_for_workers(self) -> bytes:
         """
-        Removes docstrings from the given code.
+        Serializes the objective function for the parallel_evaluate workers. The result is cached until the state
+        returned by __snapshot_worker_state changes.
 
         Args:
-            code (str): The code string to remove docstrings from.
+            None
 
         Returns:
-            str: The modified code string with docstrings removed.
+            bytes: The objective function serialized with cloudpickle.
         """
-        code = re.sub(r"\"\"\".*?\"\"\"", "", code, flags=re.DOTALL)
-        code = re.sub(r"'''.*?'''", "", code, flags=re.DOTALL)
-        return code
+        if self._worker_payload is None:
+            self._worker_payload = cloudpickle.dumps(self)
+        return self._worker_payload
 
-    def __decouple_shift_noise(self, code: str) -> str:
+    def __getstate__(self) -> dict:
         """
-        Adds shift and noise to the decoupled evaluate method.
-
-        Args:
-            code (str): The decoupled evaluate method code.
+        Returns the state to serialize without the transient caches.
 
         Returns:
-            str: The modified code with shift and noise added.
+            dict: The serializable state of the objective function.
         """
+        state = self.__dict__.copy()
+        for attribute in self._TRANSIENT_ATTRIBUTES + self._CACHED_PROPERTIES:
+            state.pop(attribute, None)
 
-        if any(self.shift):
-
-            # Find the def statement
-            def_line = re.search("def.*\n", code)[0]
-
-            # Build shift expression
-            shift_str = f"np.array({self.shift})".replace(" ", ",")
-
-            # Add the shift right after the original def statement
-            code = code.replace(def_line, def_line + f"    position += {shift_str}\n")
+        # Store the shift under its public name, the read-only buffer and its flag are rebuilt by the setter
+        state.pop("_shift_nonzero", None)
+        state["shift"] = state.pop("_shift")
 
-        if self.noise_mean or self.noise_variance:
+        return state
 
-            # Find the return statement
-            return_line = re.search("return.*", code)
-
-            # Make sure the return statement exists
-            if not return_line:
-                raise ValueError(
-                    "Could not find the return statement in the evaluate method."
-                )
-
-            # Make a copy of the return line
-            return_line_copy = return_line[0]
-
-            # Remove the last line feed(s) and combine
-            new_return_line = (
-                return_line_copy.replace("\n", "")
-                + f" + {self.noise_mean} + np.random.randn() * {self.noise_variance}"
-            )
-
-            # Replace the original return line with the modified one
-            code = code.replace(return_line_copy, new_return_line)
-
-        return code
-
-    def __decouple_evaluate(self) -> None:
+    def __setstate__(self, state: dict) -> None:
         """
-        Decouples the evaluate method from the objective function instance.
+        Restores the serialized state and resets the transient caches.
 
         Args:
-            None
+            state (dict): The serialized state of the objective function.
 
         Returns:
-            Nothing
-        """
-
-        # Get the cleartext code of the evaluate method
-        cleartext_code = inspect.getsource(self.evaluate)
-
-        # Remove docstrings
-        cleartext_code = self.__remove_docstrings(cleartext_code)
-
-        # Remove self parameter
-        cleartext_code = re.sub(r"self,", "", cleartext_code)
-
-        # Split the code into lines
-        raw_lines = cleartext_code.split("\n")
-
-        # Remove empty lines
-        code_lines = [line for line in raw_lines if line.strip()]
-
-        # Count the number of leading spaces of the first line
-        leading_spaces = len(code_lines[0]) - len(code_lines[0].lstrip())
-
-        # Remove the first leading spaces from all the lines
-        code_lines = [line[leading_spaces:] for line in code_lines]
-
-        # Combine the code lines into a single string
-        reassembled_code = "\n".join(code_lines)
-
-        # Remove references to self
-        reassembled_code = self.__remove_self_references(reassembled_code)
-
-        # Account for shift and noise
-        reassembled_code = self.__decouple_shift_noise(reassembled_code)
-
-        # Save the decoupled evaluate method to a file
-        with open(DECOUPLED_FUNCTION_PATH, "w") as file_write:
-
-            with open(__file__, "r") as file_read:
-
-                # Import all the libraries used in the objective_function.py file
-                for line in file_read.readlines():
-                    if line.startswith("def "):
-                        break
-                    elif "import" in line:
-                        file_write.write(f"{line.strip()}\n")
-
-            # Write the decoupled evaluate method
-            file_write.write(reassembled_code)
-
-    @staticmethod
-    def __delete_decoupled_evaluate() -> None:
-        """
-        Deletes the decoupled evaluate method file.
-
-        Args:
             None
-
-        Returns:
-            Nothing
         """
-        if os.path.exists(DECOUPLED_FUNCTION_PATH):
-            os.remove(DECOUPLED_FUNCTION_PATH)
+        # Restore the shift through the property to make it read-only again
+        state = dict(state)
+        self.shift = state.pop("shift")
+
+        self.__dict__.update(state)
+        for attribute in self._TRANSIENT_ATTRIBUTES:
+            self.__dict__[attribute] = None
 
     def __call__(self, position: np.ndarray) -> float:
         """
@@ -861,16 +1114,8 @@ class ObjectiveFunction(ABC):
         """
 
         # Generate random positions to evaluate
-        position = np.array(
-            [
-                np.array(
-                    [
-                        np.random.uniform(low, high)
-                        for low, high in self.search_space_bounds
-                    ]
-                )
-                for _ in range(nb_positions)
-            ]
+        position = self._rng.uniform(
+            self._lows, self._highs, size=(nb_positions, len(self._bounds))
         )
 
         # Wrap the evaluate method
@@ -882,6 +1127,8 @@ class ObjectiveFunction(ABC):
         logger.info("\nLine-by-line profiling of the .evaluate() method:\n")
 
         # Create an instance of LineProfiler and add the evaluate method to it
+        from line_profiler import LineProfiler
+
         profiler = LineProfiler()
         profiler.add_function(self.evaluate)
 
@@ -0,0 +1,432 @@
+import gc
+import pickle
+import subprocess
+import sys
+
+import matplotlib
+import numpy as np
+import pytest
+
+import src.MDAF_benchmarks as benchmarks
+from src.MDAF_benchmarks import objective_function as of
+from src.MDAF_benchmarks.implementations.sphere import DEFAULT_SETTINGS as SPHERE_SETTINGS
+
+# Render figures off-screen
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+
+class FailingSphere(of.ObjectiveFunction):
+    """
+    Sphere function evaluated one position at a time that fails for positions whose first coordinate exceeds 100.
+    """
+
+    @of.constructor
+    def __init__(self, settings: dict = {}):
+        self.validate_settings(settings, SPHERE_SETTINGS)
+        self.nb_evaluations = 0
+
+    def evaluate(self, position: np.ndarray) -> float:
+        self.nb_evaluations += 1
+        if position[0] > 100:
+            raise ValueError("Position out of range.")
+        return float(np.sum(position**2))
+
+
+@pytest.fixture(autouse=True)
+def headless_plots(monkeypatch):
+    """
+    Prevent visualize() from blocking on plt.show() and close the figures it creates.
+    """
+    monkeypatch.setattr(plt, "show", lambda *args, **kwargs: None)
+    yield
+    plt.close("all")
+
+
+@pytest.mark.parametrize("name", benchmarks.__all__)
+def test_visualize_all_implementations(name):
+    """
+    Test that every implementation can be visualized, whether or not its evaluate method supports batches.
+    """
+    objective_function = getattr(benchmarks, name)()
+    objective_function.visualize(resolution=30)
+
+
+@pytest.mark.parametrize("name", ["Rastrigin", "Griewank", "Michalewicz"])
+def test_grid_fallback_matches_row_wise_evaluation(name):
+    """
+    Test that the grid evaluation falls back to row-wise evaluation for objective functions that evaluate a
+    single position at a time.
+    """
+    objective_function = getattr(benchmarks, name)()
+
+    # Build a small grid inside the search space
+    positions = np.array([[0.5, 1.0], [1.5, -0.5], [2.0, 2.0]])
+
+    # Evaluate the grid and each position individually
+    grid_values = objective_function._ObjectiveFunction__evaluate_grid(positions)
+    expected_values = [objective_function.evaluate(position) for position in positions]
+
+    np.testing.assert_allclose(grid_values, expected_values)
+
+
+@pytest.mark.parametrize("min_cost_us", [0.0, 1e-9, 1e9])
+def test_parallel_evaluate_reports_failures_as_nan(min_cost_us):
+    """
+    Test that failed positions are reported as NaN on the parallel (min_cost_us=0), the timed then parallel (tiny
+    min_cost_us) and the serial (very high min_cost_us) paths of parallel_evaluate.
+    """
+    objective_function = FailingSphere()
+    positions = np.array([[1.0, 1.0], [200.0, 0.0], [2.0, 2.0]])
+
+    results = objective_function.parallel_evaluate(
+        positions, max_workers=2, min_cost_us=min_cost_us
+    )
+    objective_function.shutdown_workers()
+
+    np.testing.assert_array_equal(results, [2.0, np.nan, 8.0])
+
+
+def test_parallel_evaluate_serial_path_evaluates_each_position_once():
+    """
+    Test that the serial path of parallel_evaluate reuses the timed evaluation of the first position.
+    """
+    objective_function = FailingSphere()
+    positions = np.zeros((5, 2))
+
+    objective_function.parallel_evaluate(positions, min_cost_us=1e9)
+
+    assert objective_function.nb_evaluations == len(positions)
+
+
+def test_save_and_load_after_computing_derivatives(tmp_path):
+    """
+    Test that an objective function can be saved and loaded after its derivatives have been computed, and that
+    the derivatives are rebuilt after loading.
+    """
+    objective_function = benchmarks.Rastrigin()
+    position = np.array([1.0, 0.5])
+
+    # Populate the cached derivatives
+    first_derivative = objective_function.compute_first_derivative(position)
+    objective_function.compute_second_derivative(position)
+
+    # Round-trip through a file
+    path = tmp_path / "rastrigin.pkl"
+    objective_function.save(path)
+    loaded = of.ObjectiveFunction.load(path)
+
+    np.testing.assert_allclose(loaded.compute_first_derivative(position), first_derivative)
+
+
+def test_seeded_parallel_evaluate_is_reproducible():
+    """
+    Test that two identically seeded noisy objective functions return the same values from parallel_evaluate, and
+    that the parallel and serial paths agree for the same seed.
+    """
+    positions = np.random.default_rng(0).uniform(-1.0, 1.0, size=(16, 2))
+
+    # Evaluate the same positions with three identically seeded noisy objective functions
+    results = []
+    for min_cost_us in (0.0, 0.0, 1e9):
+        objective_function = FailingSphere(seed=1)
+        objective_function.apply_noise(mean=0.0, variance=1.0)
+        results.append(
+            objective_function.parallel_evaluate(
+                positions, max_workers=2, min_cost_us=min_cost_us
+            )
+        )
+        objective_function.shutdown_workers()
+
+    np.testing.assert_array_equal(results[0], results[1])
+    np.testing.assert_array_equal(results[0], results[2])
+
+
+def test_seed_is_keyword_only():
+    """
+    Test that the seed cannot be bound positionally by the constructor.
+    """
+    with pytest.raises(TypeError):
+        benchmarks.Sphere({}, 1)
+
+
+def test_parallel_evaluate_tracks_direct_assignments():
+    """
+    Test that parallel_evaluate reflects the shift, noise and parameters assigned directly rather than through
+    apply_shift and apply_noise.
+    """
+    objective_function = benchmarks.Rastrigin()
+    positions = np.array([[0.5, 1.0], [1.5, -0.5]])
+    expected_values = np.array([objective_function.evaluate(p) for p in positions])
+
+    # Prime the worker pool
+    objective_function.parallel_evaluate(positions, max_workers=2)
+
+    # The noise mean is picked up without going through apply_noise, and without restarting the workers
+    executor = objective_function._executor
+    objective_function.noise_mean = 100.0
+    results = objective_function.parallel_evaluate(positions, max_workers=2)
+    np.testing.assert_allclose(results, expected_values + 100.0)
+    objective_function.apply_noise(mean=0.0, variance=0.5)
+    objective_function.parallel_evaluate(positions, max_workers=2)
+    assert objective_function._executor is executor
+    objective_function.apply_noise(mean=0.0, variance=0.0)
+
+    # The shift is picked up without going through apply_shift
+    objective_function.shift = np.array([0.5, 1.0])
+    results = objective_function.parallel_evaluate(positions, max_workers=2)
+    np.testing.assert_allclose(results[0], 0.0, atol=1e-12)
+
+    # The parameters are picked up after an in-place update
+    objective_function.shift = np.zeros(2)
+    objective_function.parameters["A"] *= 2
+    results = objective_function.parallel_evaluate(positions, max_workers=2)
+    objective_function.shutdown_workers()
+    np.testing.assert_allclose(
+        results, [objective_function.evaluate(p) for p in positions]
+    )
+    assert not np.allclose(results, expected_values)
+
+
+def test_parallel_evaluate_reuses_and_shuts_down_the_worker_pool():
+    """
+    Test that the worker pool is reused across calls and released by shutdown_workers.
+    """
+    objective_function = benchmarks.Sphere()
+    positions = np.zeros((4, 2))
+
+    # Consecutive calls share the same pool
+    objective_function.parallel_evaluate(positions, max_workers=2)
+    executor = objective_function._executor
+    objective_function.parallel_evaluate(positions, max_workers=2)
+    assert objective_function._executor is executor
+
+    # A different number of workers starts a new pool
+    objective_function.parallel_evaluate(positions, max_workers=1)
+    assert objective_function._executor is not executor
+
+    objective_function.shutdown_workers()
+    assert objective_function._executor is None
+
+
+def test_worker_pool_is_shut_down_with_its_objective_function():
+    """
+    Test that the worker processes exit once their objective function is garbage-collected.
+    """
+    objective_function = benchmarks.Sphere()
+    objective_function.parallel_evaluate(np.zeros((4, 2)), max_workers=2)
+    processes = list(objective_function._executor._processes.values())
+
+    del objective_function
+    gc.collect()
+
+    for process in processes:
+        process.join(timeout=10)
+        assert not process.is_alive()
+
+
+def test_derivative_evaluations_are_counted():
+    """
+    Test that the evaluations of the derivatives are counted in nb_calls.
+    """
+    objective_function = benchmarks.Rastrigin()
+    position = np.array([1.0, 0.5])
+
+    objective_function.compute_first_derivative(position)
+    objective_function.compute_second_derivative(position)
+
+    assert objective_function.nb_calls == 2
+
+
+def test_silenced_counting():
+    """
+    Test that silenced_counting suspends the accounting of evaluations, including in nested contexts, and
+    restores it on exit.
+    """
+    objective_function = benchmarks.Rastrigin()
+    positions = np.zeros((3, 2))
+
+    with objective_function.silenced_counting():
+        with objective_function.silenced_counting():
+            objective_function.parallel_evaluate(positions, min_cost_us=1e9)
+        objective_function.compute_first_derivative(positions[0])
+    assert objective_function.nb_calls == 0
+
+    objective_function.parallel_evaluate(positions, min_cost_us=1e9)
+    assert objective_function.nb_calls == len(positions)
+
+
+def test_check_constraints():
+    """
+    Test the bounds check on single positions and batches, and that positions of the wrong size are rejected.
+    """
+    objective_function = benchmarks.Rastrigin()
+    lows, highs = objective_function.search_space_bounds.T
+
+    # Single positions
+    assert not objective_function.check_constraints(lows)
+    assert objective_function.check_constraints(highs + [0.0, 1.0])
+
+    # Batches of positions, the violation may occur in any row
+    assert not objective_function.check_constraints(np.array([lows, highs]))
+    assert objective_function.check_constraints(np.array([lows, highs, lows - [0.0, 1.0]]))
+
+    # Positions whose size is not a multiple of the dimensionality
+    with pytest.raises(ValueError):
+        objective_function.check_constraints(np.zeros(3))
+
+
+def test_parallel_evaluate_ships_locally_defined_classes():
+    """
+    Test that the workers receive objective functions whose class cannot be pickled by reference, along with
+    their shift.
+    """
+
+    class LocalSphere(of.ObjectiveFunction):
+        @of.constructor
+        def __init__(self, settings: dict = {}):
+            self.validate_settings(settings, SPHERE_SETTINGS)
+
+        def evaluate(self, position: np.ndarray) -> float:
+            return float(np.sum(position**2))
+
+    # Own the optimal solution position since apply_shift updates it in place
+    objective_function = LocalSphere(
+        settings={"optimal_solution_position": np.zeros(2)}
+    )
+    objective_function.apply_shift(np.array([1.0, -1.0]))
+    positions = np.array([[1.0, -1.0], [2.0, 0.0], [0.0, 0.0]])
+
+    results = objective_function.parallel_evaluate(positions, max_workers=2)
+    objective_function.shutdown_workers()
+
+    np.testing.assert_allclose(results, [0.0, 2.0, 2.0])
+
+
+def test_compile_kernels():
+    """
+    Test that compile_kernels compiles every Numba kernel.
+    """
+    of.compile_kernels()
+
+    assert of._compiled(of._add_noise).signatures
+    assert of._compiled(of._violates_bounds).signatures
+
+
+@pytest.mark.parametrize("min_cost_us", [0.0, 1e-9, 1e9])
+def test_parallel_evaluate_unwraps_single_element_arrays(min_cost_us):
+    """
+    Test that every path of parallel_evaluate returns one value per position for implementations that reshape a
+    single position to a batch of one, with and without noise.
+    """
+    objective_function = benchmarks.Rosenbrock()
+    positions = np.array([[0.5, 1.0], [1.5, -0.5], [2.0, 2.0]])
+    expected_values = objective_function.evaluate(positions)
+
+    results = objective_function.parallel_evaluate(
+        positions, max_workers=2, min_cost_us=min_cost_us
+    )
+    assert results.shape == (len(positions),)
+    np.testing.assert_allclose(results, expected_values)
+
+    objective_function.apply_noise(mean=0.0, variance=0.1)
+    results = objective_function.parallel_evaluate(
+        positions, max_workers=2, min_cost_us=min_cost_us
+    )
+    objective_function.shutdown_workers()
+    assert results.shape == (len(positions),)
+
+
+# Sphere sums over the second axis and therefore only evaluates batches of positions
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("name", [name for name in benchmarks.__all__ if name != "Sphere"])
+def test_parallel_evaluate_collects_scalars(name):
+    """
+    Test that the parallel path collects one scalar per position from every implementation without relying on the
+    deprecated conversion of single-element arrays to scalars.
+    """
+    objective_function = getattr(benchmarks, name)()
+
+    # Sample positions inside the search space
+    lows, highs = objective_function._lows, objective_function._highs
+    positions = np.random.default_rng(0).uniform(lows, highs, size=(4, len(lows)))
+
+    results = objective_function.parallel_evaluate(positions, max_workers=2)
+    objective_function.shutdown_workers()
+
+    assert results.shape == (len(positions),)
+    assert not np.any(np.isnan(results))
+
+
+def test_undefined_search_space_bounds():
+    """
+    Test that an objective function can be built without search space bounds and that check_constraints reports
+    the missing bounds.
+    """
+    objective_function = benchmarks.Sphere(
+        settings={"search_space_bounds": None, "optimal_solution_position": np.ones(2)}
+    )
+
+    with pytest.raises(ValueError, match="No constraints"):
+        objective_function.check_constraints(np.zeros(2))
+
+
+def test_shift_stays_read_only_after_pickling():
+    """
+    Test that the shift is restored read-only and consistent with the applied shift after pickling.
+    """
+    objective_function = benchmarks.Rastrigin(
+        settings={"optimal_solution_position": np.zeros(2)}
+    )
+    objective_function.apply_shift(np.array([1.0, -1.0]))
+
+    loaded = pickle.loads(pickle.dumps(objective_function))
+
+    with pytest.raises(ValueError):
+        loaded.shift[:] = 0.0
+    np.testing.assert_array_equal(loaded.shift, [1.0, -1.0])
+    assert loaded._shift_nonzero
+
+
+def test_integer_noise_parameters_reuse_the_compiled_kernel():
+    """
+    Test that integer noise parameters do not trigger the compilation of a new kernel signature.
+    """
+    of.compile_kernels()
+    kernel = of._compiled(of._add_noise)
+    nb_signatures = len(kernel.signatures)
+
+    objective_function = FailingSphere(seed=0)
+    objective_function.apply_noise(mean=0, variance=1)
+    objective_function._ObjectiveFunction__add_noise(np.zeros(of.NOISE_KERNEL_MIN_SIZE))
+
+    assert len(kernel.signatures) == nb_signatures
+
+
+def test_noise_is_the_same_below_and_above_the_kernel_threshold():
+    """
+    Test that the NumPy and compiled noise paths draw the same values from identically seeded generators.
+    """
+    values = np.arange(of.NOISE_KERNEL_MIN_SIZE, dtype=np.float64)
+
+    noisy_values = []
+    for nb_values in (of.NOISE_KERNEL_MIN_SIZE - 1, of.NOISE_KERNEL_MIN_SIZE):
+        objective_function = FailingSphere(seed=0)
+        objective_function.apply_noise(mean=1.0, variance=0.5)
+        noisy_values.append(
+            objective_function._ObjectiveFunction__add_noise(values[:nb_values])
+        )
+
+    np.testing.assert_allclose(noisy_values[0], noisy_values[1][:-1])
+
+
+def test_import_does_not_load_numba():
+    """
+    Test that importing the package does not import Numba, which is only loaded when a kernel is first used.
+    """
+    code = "import sys, src.MDAF_benchmarks; print('numba' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "False"